@@ -24,3 +24,25 @@ CA_RELATIVE_VELOCITY_TO_APPROACH_BODY_KMS = "v_rel"
 CA_RELATIVE_VELOCITY_TO_MASSLESS_BODY_KMS = "v_inf"
 CA_THREE_SIGMA_TIME_UNCERTAINTY = "t_sigma_f"
 CA_ABSOLUTE_MAGNITUDE = "h"
+
+# Column order in which the models expect their data values.
+NEO_FIELDS = (
+    NEO_PRIMARY_DESIGNATION_FIELD,
+    NEO_NAME_FIELD,
+    NEO_DIAMETER_FIELD,
+    NEO_HAZARD_FIELD,
+)
+
+CA_FIELDS = (
+    CA_PRIMARY_DESIGNATION_FIELD,
+    CA_ORBIT_ID,
+    CA_TIME_OF_CLOSE_APPROACH_JD,
+    CA_TIME_OF_CLOSE_APPROACH_CD_FORMATTED,
+    CA_APPROACH_DISTANCE_AU,
+    CA_APPROACH_DISTANCE_MIN_AU,
+    CA_APPROACH_DISTANCE_MAX_AU,
+    CA_RELATIVE_VELOCITY_TO_APPROACH_BODY_KMS,
+    CA_RELATIVE_VELOCITY_TO_MASSLESS_BODY_KMS,
+    CA_THREE_SIGMA_TIME_UNCERTAINTY,
+    CA_ABSOLUTE_MAGNITUDE,
+)
@@ -10,6 +10,11 @@ data on NEOs and close approaches extracted by `extract.load_neos` and
 `extract.load_approaches`.
 
 """
+from collections import defaultdict
+import itertools
+import operator
+
+from filters import AttributeFilter
 
 
 class NEODatabase:
@@ -44,48 +49,90 @@ class NEODatabase:
 
         # What additional auxiliary data structures will be useful?
         #
-        # Creation of data structures for fast look up of an entry based on...
-        # ...designation
-        self.designation_index_map = self.create_neo_designation_index_map()
-        # ...and name
-        self.name_to_index_map = self.create_neo_name_index_map()
-
+        # Creation of data structures for fast look up of an NEO based on
+        # designation and name, built together in a single pass.
+        (
+            self.designation_to_neo_map,
+            self.name_to_neo_map,
+        ) = self.create_neo_lookup_maps()
+
+        # Bucket the approaches by designation in a single pass, then hand each
+        # NEO its bucket wholesale rather than resolving the NEO per approach.
+        approaches_by_designation = defaultdict(list)
         for approach in self._approaches:
-            approach_designation = approach._designation
-            neo = self.get_neo_by_designation(approach_designation)
+            approaches_by_designation[approach._designation].append(approach)
+
+        for neo in self._neos:
+            neo_approaches = approaches_by_designation.get(neo.designation)
 
-            if neo:  # Found correspond neo
-                approach.neo = neo
-                neo.approaches.append(approach)
+            if neo_approaches:  # Found corresponding approaches
+                neo.approaches = neo_approaches
+                for approach in neo_approaches:
+                    approach.neo = neo
 
-    def create_neo_designation_index_map(self):
-        """Create a mapping of designation to index.
+        # Columns of approach attributes used by the filters, each built on first use.
+        self._filter_columns = {}
 
-        Method to create a designation to entry index mapping for neos to enable faster searching due to having a mapping where the designation will act as key and the value the index into the _neos data list, which can then be looked up. This should result to O(1) lookup time.
+    def create_neo_lookup_maps(self):
+        """Create mappings of designation to NEO and of name to NEO.
+
+        Both maps are populated in a single pass over the NEOs and hold the
+        `NearEarthObject`s themselves, so a lookup is a single dict access with
+        no further indexing into the _neos data list. NEOs without a name are
+        left out of the name map, so neither the empty string nor `None` is
+        ever a key.
 
         Returns:
-            dict: Map of designation to index
+            tuple: Map of designation to NEO and map of name to NEO
         """
-        designation_to_index_map = {}
+        designation_to_neo_map = {}
+        name_to_neo_map = {}
 
-        for idx, neo in enumerate(self._neos):
-            designation_to_index_map[neo.designation] = idx
+        for neo in self._neos:
+            designation_to_neo_map[neo.designation] = neo
+            if neo.name:
+                name_to_neo_map[neo.name] = neo
 
-        return designation_to_index_map
+        return designation_to_neo_map, name_to_neo_map
 
-    def create_neo_name_index_map(self):
-        """Create a neo name to neo index.
+    def get_filter_column(self, name):
+        """Get a column of approach values by filter column name, building it once.
 
-        Method to create a name to entry index mapping for neos to enable faster searching due
-        to having a mapping where the designation will act as key and the value the index
-        into the _neos data list, which can then be looked up
-        """
-        name_to_index_map = {}
+        Each column holds one value per close approach, in the same order as the
+        _approaches data list, so that filters can be evaluated a column at a
+        time rather than by walking the attributes of every approach. Approaches
+        without a linked NEO have an unknown diameter and hazard flag.
 
-        for idx, neo in enumerate(self._neos):
-            name_to_index_map[neo.name] = idx
+        Args:
+            name: The `column` named by an `AttributeFilter` subclass.
+
+        Returns:
+            tuple: The column of values, or None if no such column is known
+        """
+        column = self._filter_columns.get(name)
+        if column is not None:
+            return column
+
+        approaches = self._approaches
+        if name == "date":
+            column = tuple(approach.time.date() for approach in approaches)
+        elif name in ("distance", "velocity"):
+            column = tuple(map(operator.attrgetter(name), approaches))
+        elif name == "diameter":
+            column = tuple(
+                approach.neo.diameter if approach.neo else float("nan")
+                for approach in approaches
+            )
+        elif name == "hazardous":
+            column = tuple(
+                approach.neo.hazardous if approach.neo else None
+                for approach in approaches
+            )
+        else:
+            return None
 
-        return name_to_index_map
+        self._filter_columns[name] = column
+        return column
 
     def get_neo_by_designation(self, designation):
         """Find and return an NEO by its primary designation.
@@ -100,12 +147,7 @@ class NEODatabase:
         :param designation: The primary designation of the NEO to search for.
         :return: The `NearEarthObject` with the desired primary designation, or `None`.
         """
-        data_index = self.designation_index_map.get(designation, None)
-
-        if data_index is not None:
-            return self._neos[data_index]
-        else:
-            return None
+        return self.designation_to_neo_map.get(designation)
 
     def get_neo_by_name(self, name):
         """Find and return an NEO by its name.
@@ -121,14 +163,9 @@ class NEODatabase:
         :param name: The name, as a string, of the NEO to search for.
         :return: The `NearEarthObject` with the desired name, or `None`.
         """
-        data_index = self.name_to_index_map.get(name, None)
-
-        if data_index is not None:
-            return self._neos[data_index]
-        else:
-            return None
+        return self.name_to_neo_map.get(name)
 
-    def query(self, filters=()):
+    def query(self, filters=(), limit=None):
         """Query close approaches to generate those that match a collection of filters.
 
         This generates a stream of `CloseApproach` objects that match all of the
@@ -140,21 +177,45 @@ class NEODatabase:
         guaranteed to be sorted meaninfully, although is often sorted by time.
 
         :param filters: A collection of filters capturing user-specified criteria.
+        :param limit: The maximum number of approaches to generate, or 0 or None for no limit.
         :return: A stream of matching `CloseApproach` objects.
         """
-        if len(filters) == 0:
-            for approach in self._approaches:
-                yield approach
-
-        for approach in self._approaches:
-            passes_filter = False
-            for filter in filters:
-                if filter(approach):
-                    passes_filter = True
-                    continue
-                else:
-                    passes_filter = False
+        filters = tuple(filters)
+
+        if not filters:
+            yield from itertools.islice(self._approaches, limit or None)
+            return
+
+        # Narrow the approaches with one lazy mask per column filter first. A
+        # limited query only uses columns that are already built, as building
+        # one walks every approach while the first few matches may come early.
+        matches = None
+        callable_filters = []
+        for filter in filters:
+            values = None
+            if isinstance(filter, AttributeFilter) and filter.column is not None:
+                if not limit or filter.column in self._filter_columns:
+                    values = self.get_filter_column(filter.column)
+
+            if values is None:
+                callable_filters.append(filter)
+                continue
+
+            mask = filter.mask(values)
+            matches = mask if matches is None else map(operator.and_, matches, mask)
+
+        candidates = self._approaches
+        if matches is not None:
+            candidates = itertools.compress(candidates, matches)
+
+        # Any remaining filters are called, in order, on the surviving approaches.
+        count = 0
+        for approach in candidates:
+            for filter in callable_filters:
+                if not filter(approach):
                     break
-
-            if passes_filter:
+            else:
                 yield approach
+                count += 1
+                if count == limit:
+                    return
@@ -12,45 +12,56 @@ line, and uses the resulting collections to build an `NEODatabase`.
 
 """
 
+import csv
+import itertools
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib decoder.
+    orjson = None
+
 from models import NearEarthObject, CloseApproach
+from constants import CA_FIELDS, NEO_FIELDS
+
+# Read the data files in large chunks rather than the default 8 KiB.
+READ_BUFFER_SIZE = 1 << 20
+
 
+def index_columns(headers, fields):
+    """Resolve the position of each of the given fields within a header row.
 
-def extract_headers(neo_csv_path):
-    """Extract header from the CSV file.
+    This is done once per file so that model constructors can read their values
+    straight out of each row by position.
 
     Args:
-        neo_csv_path: The location of the neo csv datafile.
+        headers: A sequence of column names as they appear in the data file.
+        fields: The column names to locate, in the order the model expects them.
 
     Returns:
-        A list of headers from the csv file.
+        A tuple of column indices, one per field.
     """
-    with open(neo_csv_path) as file:
-        line = file.readline()
-        headers = line.split(",")
-        return headers
+    return tuple(headers.index(field) for field in fields)
 
 
-def extract_data(headers, neo_csv_file):
-    """Retrieve NEO data from csv file and construct NearEarthObject istances with said data.
+def extract_data(neo_csv_path):
+    """Retrieve NEO data from csv file and construct NearEarthObject instances with said data.
 
-    :param headers: A list of strings of header names
-    :param neo_csv_file: A path to a CSV file containing data about near-Earth objects.
-    """
-    neos = []
-
-    with open(neo_csv_file) as file:
-        file.readline()  # Discard header line
+    The header row is consumed from the same reader as the data rows, and the
+    `csv` module takes care of quoted fields (such as quoted designations or
+    names containing commas) which a plain `str.split` gets wrong.
 
-        for line in file:
-            data = line.split(",")
-            raw_neo_data_item = zip(
-                data, headers
-            )  # Data, header pairs; data first so as to retrieve all column names
+    :param neo_csv_path: A path to a CSV file containing data about near-Earth objects.
+    :return: A list of `NearEarthObject`s.
+    """
+    with open(
+        neo_csv_path, newline="", encoding="utf-8", buffering=READ_BUFFER_SIZE
+    ) as file:
+        reader = csv.reader(file)
+        headers = next(reader)
+        column_indices = index_columns(headers, NEO_FIELDS)
 
-            neo = NearEarthObject(raw_neo_data_item)
-            neos.append(neo)
+        neos = list(map(NearEarthObject, reader, itertools.repeat(column_indices)))
 
     return neos
 
@@ -61,8 +72,7 @@ def load_neos(neo_csv_path):
     :param neo_csv_path: A path to a CSV file containing data about near-Earth objects.
     :return: A collection of `NearEarthObject`s.
     """
-    headers = extract_headers(neo_csv_path)
-    neos = extract_data(headers, neo_csv_path)
+    neos = extract_data(neo_csv_path)
 
     return neos
 
@@ -76,26 +86,19 @@ def extract_json(cad_json_path):
     Returns:
         approaches: A list of close approaches extracted from the data file
     """
-    approaches = []
-
-    with open(cad_json_path) as json_file:
-        raw_approaches = json.load(json_file)
-
-        count = int(raw_approaches["count"])
-        headers = raw_approaches["fields"]
-        data = raw_approaches["data"]
-
-        for x in range(count):
-            data_items = data[x]
-            raw_approach_data_item = zip(
-                data_items, headers
-            )  # Tie data items to column names
-            close_approach = CloseApproach(
-                raw_approach_data_item
-            )  # Create CA object from data, headers object
-            approaches.append(close_approach)
-
-        return approaches
+    with open(cad_json_path, "rb", buffering=READ_BUFFER_SIZE) as json_file:
+        if orjson is not None:
+            raw_approaches = orjson.loads(json_file.read())
+        else:
+            raw_approaches = json.load(json_file)
+
+    column_indices = index_columns(raw_approaches["fields"], CA_FIELDS)
+
+    approaches = list(
+        map(CloseApproach, raw_approaches["data"], itertools.repeat(column_indices))
+    )
+
+    return approaches
 
 
 def load_approaches(cad_json_path):
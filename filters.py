@@ -38,8 +38,22 @@ class AttributeFilter:
 
     Concrete subclasses can override the `get` classmethod to provide custom
     behavior to fetch a desired attribute from the given `CloseApproach`.
+
+    Subclasses may also name a `column` of values that the `NEODatabase` holds
+    for every close approach (matching what `get` would return), which lets the
+    database evaluate the filter over the whole column at once with `mask`. A
+    subclass that overrides `get` without declaring its own column has no
+    column, and is called per approach.
     """
 
+    column = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Drop an inherited `column` that an overridden `get` no longer matches."""
+        super().__init_subclass__(**kwargs)
+        if "get" in cls.__dict__ and "column" not in cls.__dict__:
+            cls.column = None
+
     def __init__(self, op, value):
         """Construct a new `AttributeFilter` from an binary predicate and a reference value.
 
@@ -58,6 +72,14 @@ class AttributeFilter:
         """Invoke `self(approach)`."""
         return self.op(self.get(approach), self.value)
 
+    def mask(self, values):
+        """Evaluate this filter over a column of attribute values.
+
+        :param values: An iterable of values, as would be returned by `get`, one per approach.
+        :return: An iterator of booleans, one per value, for whether the value satisfies this filter.
+        """
+        return map(self.op, values, itertools.repeat(self.value))
+
     @classmethod
     def get(cls, approach):
         """Get an attribute of interest from a close approach.
@@ -78,6 +100,8 @@ class AttributeFilter:
 class ApproachVelocityFilter(AttributeFilter):
     """A filter to allow approach velocity filtering."""
 
+    column = "velocity"
+
     @classmethod
     def get(cls, approach):
         """Return approach velocity."""
@@ -87,6 +111,8 @@ class ApproachVelocityFilter(AttributeFilter):
 class DistanceFilter(AttributeFilter):
     """A filter to allow approach distance filtering."""
 
+    column = "distance"
+
     @classmethod
     def get(cls, approach):
         """Return approach distance."""
@@ -96,6 +122,8 @@ class DistanceFilter(AttributeFilter):
 class DiameterFilter(AttributeFilter):
     """A filter to allow approach distance filtering."""
 
+    column = "diameter"
+
     @classmethod
     def get(cls, approach):
         """Return approach neo diameter."""
@@ -108,6 +136,8 @@ class DiameterFilter(AttributeFilter):
 class HazardousFilter(AttributeFilter):
     """A filter to allow approach neo is harardous filtering."""
 
+    column = "hazardous"
+
     @classmethod
     def get(cls, approach):
         """Return approach hazardous flag."""
@@ -117,6 +147,8 @@ class HazardousFilter(AttributeFilter):
 class AbsoluteDateFilter(AttributeFilter):
     """A filter to allow absolute approach date filtering."""
 
+    column = "date"
+
     @classmethod
     def get(cls, approach):
         """Return approach time as date."""
@@ -126,6 +158,8 @@ class AbsoluteDateFilter(AttributeFilter):
 class DateFilter(AttributeFilter):
     """A filter to allow approach date filtering."""
 
+    column = "date"
+
     @classmethod
     def get(cls, approach):
         """Return approach time as date."""
@@ -13,6 +13,23 @@ provide that level of resolution, so the output format also will not.
 import datetime
 
 
+# English month abbreviations, as used by NASA regardless of the local locale.
+MONTH_NUMBERS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
 def cd_to_datetime(calendar_date):
     """Convert a NASA-formatted calendar date/time description into a datetime.
 
@@ -23,9 +40,33 @@ def cd_to_datetime(calendar_date):
 
     This will become the Python object `datetime.datetime(2020, 12, 31, 12, 0)`.
 
+    The fixed layout is split apart by hand, which is several times faster than
+    `strptime` across the hundreds of thousands of close approaches. Only plain
+    ASCII digit fields of the widths `strptime` accepts are converted this way;
+    anything else is handed to `strptime`, which parses it or raises as usual.
+
     :param calendar_date: A calendar date in YYYY-bb-DD hh:mm format.
     :return: A naive `datetime` corresponding to the given calendar date and time.
     """
+    try:
+        date, time = calendar_date.split(" ")
+        year, month, day = date.split("-")
+        hour, minute = time.split(":")
+        digits = year + day + hour + minute
+        if (
+            len(year) == 4
+            and 1 <= len(day) <= 2
+            and 1 <= len(hour) <= 2
+            and 1 <= len(minute) <= 2
+            and digits.isascii()
+            and digits.isdigit()
+        ):
+            return datetime.datetime(
+                int(year), MONTH_NUMBERS[month], int(day), int(hour), int(minute)
+            )
+    except (KeyError, ValueError):
+        pass
+
     return datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
 
 
@@ -46,7 +46,7 @@ import time
 
 from extract import load_neos, load_approaches
 from database import NEODatabase
-from filters import create_filters, limit
+from filters import create_filters
 from write import write_to_csv, write_to_json
 
 
@@ -302,19 +302,23 @@ def query(database, args):
         diameter_max=args.diameter_max,
         hazardous=args.hazardous,
     )
-    # Query the database with the collection of filters.
-    results = database.query(filters)
+    # Query the database with the collection of filters. Results written to
+    # stdout are limited to 10 entries if no limit was specified.
+    if not args.outfile:
+        results = database.query(filters, limit=args.limit or 10)
+    else:
+        results = database.query(filters, limit=args.limit)
 
     if not args.outfile:
-        # Write the results to stdout, limiting to 10 entries if not specified.
-        for result in limit(results, args.limit or 10):
+        # Write the results to stdout.
+        for result in results:
             print(result)
     else:
         # Write the results to a file.
         if args.outfile.suffix == ".csv":
-            write_to_csv(limit(results, args.limit), args.outfile)
+            write_to_csv(results, args.outfile)
         elif args.outfile.suffix == ".json":
-            write_to_json(limit(results, args.limit), args.outfile)
+            write_to_json(results, args.outfile)
         else:
             print(
                 "Please use an output file that ends with `.csv` or `.json`.",
@@ -16,25 +16,9 @@ data files from NASA, so these objects should be able to handle all of the
 quirks of the data set, such as missing names and unknown diameters.
 
 """
+import sys
+
 from helpers import cd_to_datetime, datetime_to_str
-from constants import (
-    CA_ABSOLUTE_MAGNITUDE,
-    CA_APPROACH_DISTANCE_AU,
-    CA_APPROACH_DISTANCE_MAX_AU,
-    CA_APPROACH_DISTANCE_MIN_AU,
-    CA_ORBIT_ID,
-    CA_PRIMARY_DESIGNATION_FIELD,
-    CA_RELATIVE_VELOCITY_TO_APPROACH_BODY_KMS,
-    CA_RELATIVE_VELOCITY_TO_MASSLESS_BODY_KMS,
-    CA_THREE_SIGMA_TIME_UNCERTAINTY,
-    CA_TIME_OF_CLOSE_APPROACH_CD_FORMATTED,
-    CA_TIME_OF_CLOSE_APPROACH_JD,
-    NEO_DIAMETER_FIELD,
-    NEO_ID_FIELD,
-    NEO_NAME_FIELD,
-    NEO_PRIMARY_DESIGNATION_FIELD,
-    NEO_HAZARD_FIELD,
-)
 
 
 class NearEarthObject:
@@ -50,62 +34,50 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
+    # Tens of thousands of NEOs are loaded, so leave each without a __dict__.
+    __slots__ = (
+        "designation",
+        "name",
+        "fullname",
+        "diameter",
+        "hazardous",
+        "approaches",
+    )
+
     # Q: How can you, and should you, change the arguments to this constructor?
     #    If you make changes, be sure to update the comments in this file.
     #
-    # A: Yes, I changed the signature to make the class more testable.
+    # A: Yes, I changed the signature to make the class more testable. The
+    #    constructor takes a row of data values and the positions of the
+    #    `constants.NEO_FIELDS` columns within it, resolved once per file.
 
-    def __init__(self, zipped_item):
+    def __init__(self, data, column_indices):
         """Create a new `NearEarthObject`.
 
-        :param info: A zip object of data values [0] and respective column names [1]
+        :param data: A sequence of data values for a single NEO
+        :param column_indices: Indices into `data` of the `constants.NEO_FIELDS` columns
         """
-        self.hazardous = False
-        for item in zipped_item:
-            data = item[0]
-            field = item[1]
-
-            if field == NEO_ID_FIELD:
-                self.id = data
-            elif field == NEO_PRIMARY_DESIGNATION_FIELD:
-                self.designation = data
-            elif field == NEO_NAME_FIELD:
-                name = data
-                formatted_name = self.neaten_name(name)
-                if (
-                    len(formatted_name) == 0
-                ):  # Ensure empty string is represented by None
-                    formatted_name = None
-                self.name = formatted_name
-            elif field == NEO_DIAMETER_FIELD:
-                diameter = data
-                if len(diameter) == 0:
-                    diameter = float("nan")
-                self.diameter = float(diameter)
-            elif field == NEO_HAZARD_FIELD:
-                hazardous = data
-
-                if hazardous.upper() == "Y":
-                    self.hazardous = True
-                else:
-                    self.hazardous - False
+        designation_index, name_index, diameter_index, hazard_index = column_indices
+
+        self.designation = sys.intern(data[designation_index])
+
+        # Ensure empty strings are represented by None and NaN respectively.
+        self.name = self.neaten_name(data[name_index]) or None
+        # Built once here rather than on every access.
+        self.fullname = (
+            f"{self.designation} ({self.name})" if self.name else self.designation
+        )
+        diameter = data[diameter_index]
+        self.diameter = float(diameter) if diameter else float("nan")
+
+        self.hazardous = data[hazard_index].upper() == "Y"
 
         # Create an empty initial collection of linked approaches.
         self.approaches = []
 
     def neaten_name(self, name):
-        """Remove spurious characters from name."""
-        first = name.lstrip('"')
-        second = first.rstrip('"')
-        third = second.lstrip()
-        fourth = third.rstrip()
-
-        return fourth
-
-    @property
-    def fullname(self):
-        """Return a representation of the full name of this NEO."""
-        return self.designation + "::" + self.name
+        """Remove spurious quotes and surrounding whitespace from name."""
+        return name.strip(' "\t\r\n')
 
     def __str__(self):
         """Return `str(self)`."""
@@ -118,26 +90,24 @@ class NearEarthObject:
         A computer-readable string representation of this object.
         """
         return (
-            f"NearEarthObject(designation={self.designation!r},  \
-              name={self.name!r}, "
+            f"NearEarthObject(designation={self.designation!r}, name={self.name!r}, "
             f"diameter={self.diameter:.3f}, hazardous={self.hazardous!r})"
         )
 
     def serialize(self):
         """Create a dictionary representing the NEO in terms of required data.
 
-        Return a map of relevant data items for the output CSV and JSON
+        Return a map of relevant data items for the output JSON. A missing name
+        is given as the empty string; the other values keep their types.
 
-        :return Map of this NEO coerced into strings
+        :return Map of this NEO's output fields to their values
         """
-        results = {}
-
-        results["designation"] = str(self.designation)
-        results["name"] = str(self.name)
-        results["diameter_km"] = str(self.diameter)
-        results["potentially_hazardous"] = str(self.hazardous)
-
-        return results
+        return {
+            "designation": self.designation,
+            "name": self.name or "",
+            "diameter_km": self.diameter,
+            "potentially_hazardous": self.hazardous,
+        }
 
 
 class CloseApproach:
@@ -154,52 +124,64 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
-    def __init__(self, close_approach):
+    # The approaches far outnumber the NEOs; slots save most of their memory.
+    __slots__ = (
+        "_designation",
+        "orbit_id",
+        "jd_time",
+        "time",
+        "distance",
+        "approach_distance_min",
+        "approach_distance_max",
+        "velocity",
+        "velocity_to_massless_body",
+        "time_uncertainty",
+        "magnitude",
+        "neo",
+    )
+
+    def __init__(self, data, column_indices):
         """Create a new `CloseApproach`.
 
-        :param info: A zipped data, header iterable representing a JSON close approach
+        :param data: A sequence of data values for a single JSON close approach
+        :param column_indices: Indices into `data` of the `constants.CA_FIELDS` columns
         """
-        self.magnitude = 0.0
-
-        for pair in close_approach:
-            data = pair[0]
-            header = pair[1]
-
-            if header == CA_PRIMARY_DESIGNATION_FIELD:
-                self._designation = data
-            elif header == CA_ORBIT_ID:
-                self.orbit_id = data
-            elif header == CA_TIME_OF_CLOSE_APPROACH_JD:
-                self.jd_time = float(data)
-            elif header == CA_TIME_OF_CLOSE_APPROACH_CD_FORMATTED:
-                self.time = cd_to_datetime(data)
-            elif header == CA_APPROACH_DISTANCE_AU:
-                self.distance = float(data)
-            elif header == CA_APPROACH_DISTANCE_MIN_AU:
-                self.approach_distance_min = float(data)
-            elif header == CA_APPROACH_DISTANCE_MAX_AU:
-                if data is None or len(data) == 0:
-                    data = 0.0
-                self.approach_distance_max = float(data)
-            elif header == CA_RELATIVE_VELOCITY_TO_APPROACH_BODY_KMS:
-                if data is None or len(data) == 0:
-                    data = 0.0
-                self.velocity = float(data)
-            elif header == CA_RELATIVE_VELOCITY_TO_MASSLESS_BODY_KMS:
-                if data is None or len(data) == 0:
-                    data = 0.0
-                self.velocity_to_massless_body = float(data)
-            elif header == CA_THREE_SIGMA_TIME_UNCERTAINTY:
-                self.time_uncertainty = data
-            elif header == CA_ABSOLUTE_MAGNITUDE:
-                if data is not None:
-                    self.magnitude == float(data)
-                else:
-                    self.magnitude = 0.0
-
-        # Ensure velocity is always populated!
-        if not hasattr(self, "velocity"):
-            self.velocity = float(0.0)
+        (
+            designation_index,
+            orbit_id_index,
+            jd_index,
+            cd_index,
+            distance_index,
+            distance_min_index,
+            distance_max_index,
+            velocity_index,
+            velocity_to_massless_body_index,
+            time_uncertainty_index,
+            magnitude_index,
+        ) = column_indices
+
+        # Interned, so that the many approaches of one NEO share a single string.
+        self._designation = sys.intern(data[designation_index])
+        self.orbit_id = data[orbit_id_index]
+        self.jd_time = float(data[jd_index])
+        self.time = cd_to_datetime(data[cd_index])
+        self.distance = float(data[distance_index])
+        self.approach_distance_min = float(data[distance_min_index])
+
+        # Optional fields may be null or empty; those default to 0.0.
+        approach_distance_max = data[distance_max_index]
+        self.approach_distance_max = (
+            float(approach_distance_max) if approach_distance_max else 0.0
+        )
+        velocity = data[velocity_index]
+        self.velocity = float(velocity) if velocity else 0.0
+        velocity_to_massless_body = data[velocity_to_massless_body_index]
+        self.velocity_to_massless_body = (
+            float(velocity_to_massless_body) if velocity_to_massless_body else 0.0
+        )
+        self.time_uncertainty = data[time_uncertainty_index]
+        magnitude = data[magnitude_index]
+        self.magnitude = float(magnitude) if magnitude else 0.0
 
         # Create an attribute for the referenced NEO, originally None.
         self.neo = None
@@ -242,11 +224,7 @@ class CloseApproach:
 
         if self.neo:
             approach["neo"] = self.neo
-            approach["name"] = self.neo.name
-            if hasattr(self.neo, "name") and self.neo.name is not None:
-                approach["name"] = self.neo.name
-            else:
-                approach["name"] = ""
+            approach["name"] = self.neo.name or ""
         else:
             approach["name"] = ""
 
@@ -114,6 +114,10 @@ class TestDatabase(unittest.TestCase):
         nonexistent = self.db.get_neo_by_name('not-real-name')
         self.assertIsNone(nonexistent)
 
+    def test_get_neo_by_name_empty_or_none(self):
+        self.assertIsNone(self.db.get_neo_by_name(''))
+        self.assertIsNone(self.db.get_neo_by_name(None))
+
 
 if __name__ == '__main__':
     unittest.main()
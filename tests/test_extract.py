@@ -14,9 +14,11 @@ import collections.abc
 import datetime
 import pathlib
 import math
+import tempfile
 import unittest
 
-from extract import load_neos, load_approaches
+from extract import index_columns, load_neos, load_approaches
+from constants import NEO_FIELDS
 from models import NearEarthObject, CloseApproach
 
 
@@ -76,13 +78,16 @@ class TestLoadNEOs(unittest.TestCase):
         self.assertEqual(neo.name, 'Adonis')
         self.assertEqual(neo.diameter, 0.6)
         self.assertEqual(neo.hazardous, True)
+
+    def test_neo_fullname(self):
+        self.assertEqual(self.neos_by_designation['2101'].fullname, '2101 (Adonis)')
+        self.assertEqual(self.neos_by_designation['2019 SC8'].fullname, '2019 SC8')
     
     def test_can_construct_neo_happy_path(self):
         headers = ["pdes",  "name" ,                         "neo", "pha", "diameter"]
         data =    ["12345", "\"   719 Albert (A911 TB)\"",   "Y",   "Y",   "1234.5"]
 
-        mock_data = zip(data, headers)
-        neo = NearEarthObject(mock_data)
+        neo = NearEarthObject(data, index_columns(headers, NEO_FIELDS))
 
         self.assertEquals(neo.designation, "12345")
         self.assertEquals(neo.name, "719 Albert (A911 TB)")
@@ -94,8 +99,7 @@ class TestLoadNEOs(unittest.TestCase):
         headers = ["pdes",  "name" ,                         "neo", "pha", "diameter"]
         data =    ["12345", "\"   719 Albert (A911 TB)\"",   "Y",   "N",   "1234.5"]
 
-        mock_data = zip(data, headers)
-        neo = NearEarthObject(mock_data)
+        neo = NearEarthObject(data, index_columns(headers, NEO_FIELDS))
 
         self.assertEquals(neo.designation, "12345")
         self.assertEquals(neo.name, "719 Albert (A911 TB)")
@@ -107,8 +111,7 @@ class TestLoadNEOs(unittest.TestCase):
         headers = ["pdes",  "name" ,                         "neo", "pha", "diameter"]
         data =    ["12345", "\"   719 Albert (A911 TB)\"",   "Y",   "N",   ""]
 
-        mock_data = zip(data, headers)
-        neo = NearEarthObject(mock_data)
+        neo = NearEarthObject(data, index_columns(headers, NEO_FIELDS))
 
         self.assertEquals(neo.designation, "12345")
         self.assertEquals(neo.name, "719 Albert (A911 TB)")
@@ -116,6 +119,24 @@ class TestLoadNEOs(unittest.TestCase):
         self.assertTrue(math.isnan(neo.diameter))
         self.assertEquals(neo.approaches, [])
 
+    def test_load_neos_handles_quoted_fields(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / 'quoted-neos.csv'
+            path.write_text(
+                'id,full_name,pdes,name,pha,diameter\n'
+                'bK05O03E,"       (2005 OE3)","2005 OE3",,Y,\n'
+                'a0000433,"   433 Eros, (A898 PA)",433,Eros,N,16.84\n'
+            )
+            neos = load_neos(path)
+
+        self.assertEqual(len(neos), 2)
+        self.assertEqual(neos[0].designation, '2005 OE3')
+        self.assertEqual(neos[0].name, None)
+        self.assertTrue(neos[0].hazardous)
+        self.assertEqual(neos[1].designation, '433')
+        self.assertEqual(neos[1].name, 'Eros')
+        self.assertEqual(neos[1].diameter, 16.84)
+
 
 class TestLoadApproaches(unittest.TestCase):
     @classmethod
@@ -155,6 +176,11 @@ class TestLoadApproaches(unittest.TestCase):
         approach = self.get_first_approach_or_none()
         self.assertIsNotNone(approach)
         self.assertIsInstance(approach.velocity, float)
+
+    def test_approach_magnitude_is_parsed(self):
+        approach = self.get_first_approach_or_none()
+        self.assertIsNotNone(approach)
+        self.assertEqual(approach.magnitude, 25.1)
     
 
 
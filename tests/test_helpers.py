@@ -0,0 +1,39 @@
+"""Check that NASA calendar dates convert to and from datetimes.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_helpers
+"""
+import datetime
+import unittest
+
+from helpers import cd_to_datetime, datetime_to_str
+
+
+class TestHelpers(unittest.TestCase):
+    def test_cd_to_datetime(self):
+        self.assertEqual(cd_to_datetime('2020-Dec-31 12:00'), datetime.datetime(2020, 12, 31, 12, 0))
+        self.assertEqual(cd_to_datetime('1900-Jan-01 00:00'), datetime.datetime(1900, 1, 1, 0, 0))
+        self.assertEqual(cd_to_datetime('2099-Sep-09 23:59'), datetime.datetime(2099, 9, 9, 23, 59))
+
+    def test_cd_to_datetime_matches_strptime_for_every_month(self):
+        for month in range(1, 13):
+            expected = datetime.datetime(2020, month, 15, 6, 30)
+            self.assertEqual(cd_to_datetime(expected.strftime('%Y-%b-%d %H:%M')), expected)
+
+    def test_cd_to_datetime_rejects_malformed_dates(self):
+        malformed = (
+            '2020-Foo-31 12:00', '2020-Feb-30 12:00', '2020-12-31 12:00', '2020-Dec-31',
+            '2020-Dec-3_1 12:00', '2020-Dec-+31 12:00', '2020-Dec-31 12:0_0', '20_20-Dec-31 12:00',
+            '2020-Dec-\u0663\u0661 12:00',
+        )
+        for calendar_date in malformed:
+            with self.assertRaises(ValueError):
+                cd_to_datetime(calendar_date)
+
+    def test_datetime_to_str(self):
+        self.assertEqual(datetime_to_str(datetime.datetime(2020, 12, 31, 12, 0)), '2020-12-31 12:00')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,12 +13,15 @@ To run these tests from the project root, run::
 These tests should pass when Tasks 3a and 3b are complete.
 """
 import datetime
+import operator
 import pathlib
 import unittest
 
+from constants import CA_FIELDS
 from database import NEODatabase
-from extract import load_neos, load_approaches
-from filters import create_filters
+from extract import index_columns, load_neos, load_approaches
+from filters import DistanceFilter, create_filters
+from models import CloseApproach
 
 
 TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
@@ -44,6 +47,89 @@ class TestQuery(unittest.TestCase):
         received = set(self.db.query(filters))
         self.assertEqual(expected, received, msg="Computed results do not match expected results.")
 
+    def test_query_all_yields_each_approach_once(self):
+        received = list(self.db.query(create_filters()))
+        self.assertEqual(len(received), len(self.approaches))
+
+    def test_query_with_plain_callable_filter(self):
+        expected = set(
+            approach for approach in self.approaches
+            if approach.distance <= 0.1 and approach.neo.name
+        )
+        self.assertGreater(len(expected), 0)
+
+        filters = create_filters(distance_max=0.1) + [lambda approach: bool(approach.neo.name)]
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_with_truthy_callable_filter(self):
+        expected = set(
+            approach for approach in self.approaches
+            if approach.distance <= 0.1 and approach.neo.name
+        )
+        self.assertGreater(len(expected), 0)
+
+        filters = create_filters(distance_max=0.1) + [lambda approach: approach.neo and approach.neo.name]
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_callable_filters_short_circuit_in_order(self):
+        neos = load_neos(TEST_NEO_FILE)
+        approaches = list(load_approaches(TEST_CAD_FILE))
+        unlinked = CloseApproach(
+            ['not-a-designation', '1', '2458849.5', '2020-Jan-01 00:00', '0.01', '0.01', '0.01', '5.0', '5.0', '< 00:01', '25.0'],
+            index_columns(list(CA_FIELDS), CA_FIELDS),
+        )
+        approaches.append(unlinked)
+        db = NEODatabase(neos, approaches)
+
+        filters = create_filters(distance_max=0.1) + [
+            lambda approach: approach.neo is not None,
+            lambda approach: approach.neo.diameter > 0,
+        ]
+        received = set(db.query(filters))
+        expected = set(
+            approach for approach in approaches
+            if approach.distance <= 0.1 and approach.neo is not None and approach.neo.diameter > 0
+        )
+        self.assertGreater(len(expected), 0)
+        self.assertNotIn(unlinked, received)
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_with_filter_subclass_overriding_get(self):
+        class DoubledDistanceFilter(DistanceFilter):
+            @classmethod
+            def get(cls, approach):
+                return approach.distance * 2
+
+        expected = set(
+            approach for approach in self.approaches
+            if approach.distance * 2 <= 0.1
+        )
+        self.assertGreater(len(expected), 0)
+
+        received = set(self.db.query([DoubledDistanceFilter(operator.le, 0.1)]))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_with_limit(self):
+        db = NEODatabase(load_neos(TEST_NEO_FILE), load_approaches(TEST_CAD_FILE))
+        filters = create_filters(start_date=datetime.date(2020, 3, 1), distance_max=0.1)
+        expected = list(db.query(filters))
+        self.assertGreater(len(expected), 3)
+
+        # Once before and once after the columns are built by an unlimited query.
+        db = NEODatabase(load_neos(TEST_NEO_FILE), load_approaches(TEST_CAD_FILE))
+        self.assertEqual(
+            [approach.time for approach in db.query(filters, limit=3)],
+            [approach.time for approach in expected[:3]],
+        )
+        list(db.query(filters))
+        self.assertEqual(
+            [approach.time for approach in db.query(filters, limit=3)],
+            [approach.time for approach in expected[:3]],
+        )
+        self.assertEqual(len(list(db.query(limit=3))), 3)
+
     ###############################################
     # Single filters and pairs of related filters #
     ###############################################
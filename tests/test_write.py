@@ -21,13 +21,19 @@ import datetime
 import io
 import json
 import pathlib
+import tempfile
 import unittest
 import unittest.mock
 
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 
 from extract import load_neos, load_approaches
 from database import NEODatabase
-from write import write_to_csv, write_to_json
+from write import encode_json, write_to_csv, write_to_json
 
 
 TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
@@ -65,6 +71,22 @@ def UncloseableStringIO(value=''):
     buf.close()
 
 
+@contextlib.contextmanager
+def UncloseableBytesIO(value=b''):
+    """A context manager for an uncloseable `io.BytesIO`.
+
+    The binary counterpart of `UncloseableStringIO`, for writers that open
+    their output file in binary mode.
+    """
+    buf = io.BytesIO(value)
+    buf._close = buf.close
+    buf.close = lambda: False
+    yield buf
+    buf.close = buf._close
+    delattr(buf, '_close')
+    buf.close()
+
+
 class TestWriteToCSV(unittest.TestCase):
     @classmethod
     @unittest.mock.patch('write.open')
@@ -127,7 +149,7 @@ class TestWriteToCSV(unittest.TestCase):
         except csv.Error as err:
             raise self.failureException("write_to_csv produced an invalid CSV format.") from err
 
-        fieldnames = ('datetime_utc', 'distance_au', 'velocity_km_s', 'designation', 'name', 'diameter_km', 'potentially_hazardous', '')
+        fieldnames = ('datetime_utc', 'distance_au', 'velocity_km_s', 'designation', 'name', 'diameter_km', 'potentially_hazardous')
         self.assertGreater(len(rows), 0)
         self.assertSetEqual(set(fieldnames), set(rows[0].keys()))
 
@@ -137,8 +159,9 @@ class TestWriteToJSON(unittest.TestCase):
     @unittest.mock.patch('write.open')
     def setUpClass(cls, mock_file):
         results = build_results(5)
+        cls.results = results
 
-        with UncloseableStringIO() as buf:
+        with UncloseableBytesIO() as buf:
             mock_file.return_value = buf
             try:
                 write_to_json(results, None)
@@ -149,7 +172,7 @@ class TestWriteToJSON(unittest.TestCase):
             else:
                 # Rewind the unclosed buffer to fetch the contents saved to "disk".
                 buf.seek(0)
-                cls.value = buf.getvalue()
+                cls.value = buf.getvalue().decode('utf-8')
 
     def test_json_data_is_well_formed(self):
         # Now, we have the value in memory, and can _actually_ start testing.
@@ -159,6 +182,36 @@ class TestWriteToJSON(unittest.TestCase):
         except json.JSONDecodeError as err:
             raise self.failureException("write_to_json produced an invalid JSON document") from err
 
+    def test_json_data_is_laid_out_like_the_stdlib_encoder(self):
+        data = json.loads(self.value)
+        expected = json.dumps(data, separators=(',', ':'))
+        self.assertEqual(self.value, expected)
+
+    @unittest.mock.patch('write.open')
+    def test_pretty_json_data_is_laid_out_like_the_stdlib_encoder(self, mock_file):
+        with UncloseableBytesIO() as buf:
+            mock_file.return_value = buf
+            write_to_json(self.results, None, pretty=True)
+            value = buf.getvalue().decode('utf-8')
+
+        expected = json.dumps(json.loads(value), sort_keys=True, indent=2, separators=(',', ': '))
+        self.assertEqual(value, expected)
+
+    @unittest.mock.patch('write.open')
+    def test_json_data_with_no_results_is_an_empty_list(self, mock_file):
+        with UncloseableBytesIO() as buf:
+            mock_file.return_value = buf
+            write_to_json([], None)
+            self.assertEqual(json.loads(buf.getvalue()), [])
+
+    def test_json_data_matches_results(self):
+        data = json.loads(self.value)
+        for entry, approach in zip(data, self.results):
+            self.assertEqual(entry['datetime_utc'], approach.time_str)
+            self.assertEqual(entry['distance_au'], approach.distance)
+            self.assertEqual(entry['neo']['designation'], approach.neo.designation)
+            self.assertEqual(entry['neo']['potentially_hazardous'], approach.neo.hazardous)
+
     def test_json_data_is_a_sequence(self):
         buf = io.StringIO(self.value)
         try:
@@ -226,5 +279,81 @@ class TestWriteToJSON(unittest.TestCase):
         self.assertIsInstance(approach['neo']['potentially_hazardous'], bool)
 
 
+class TestWriteWithSync(unittest.TestCase):
+    def test_write_with_sync(self):
+        results = build_results(5)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = pathlib.Path(tmpdir) / 'results.csv'
+            json_path = pathlib.Path(tmpdir) / 'results.json'
+            write_to_csv(results, csv_path, sync=True)
+            write_to_json(results, json_path, sync=True)
+
+            with open(csv_path, newline='') as f:
+                self.assertEqual(len(tuple(csv.DictReader(f))), 5)
+            with open(json_path) as f:
+                self.assertEqual(len(json.load(f)), 5)
+
+
+class TestEncodeJSON(unittest.TestCase):
+    def setUp(self):
+        self.entry = {
+            'datetime_utc': '2025-11-30 02:18',
+            'distance_au': 0.397647483265833,
+            'velocity_km_s': 3.72885069167641,
+            'neo': {'designation': '433', 'name': 'Eros', 'diameter_km': 16.84, 'potentially_hazardous': False},
+        }
+
+    def test_encode_json_matches_stdlib_layout(self):
+        expected = json.dumps(self.entry, separators=(',', ':'))
+        self.assertEqual(encode_json(self.entry).decode('utf-8'), expected)
+
+    def test_encode_json_pretty_matches_stdlib_layout(self):
+        expected = json.dumps(self.entry, sort_keys=True, indent=2, separators=(',', ': '))
+        self.assertEqual(encode_json(self.entry, pretty=True).decode('utf-8'), expected)
+
+    def test_encode_json_keeps_nan_diameter(self):
+        self.entry['neo']['diameter_km'] = float('nan')
+        self.assertIn('"diameter_km":NaN', encode_json(self.entry).decode('utf-8'))
+        self.assertIn('"diameter_km": NaN', encode_json(self.entry, pretty=True).decode('utf-8'))
+
+    def test_encode_json_uses_ujson_without_orjson(self):
+        stub = unittest.mock.Mock()
+        stub.dumps.side_effect = lambda obj, **kwargs: json.dumps(obj, separators=(',', ':'))
+        with unittest.mock.patch('write.orjson', None), unittest.mock.patch('write.ujson', stub):
+            expected = json.dumps(self.entry, separators=(',', ':'))
+            self.assertEqual(encode_json(self.entry).decode('utf-8'), expected)
+            stub.dumps.assert_called_once_with(self.entry, escape_forward_slashes=False)
+
+            # Pretty output and NaN diameters are left to ujson too.
+            stub.dumps.reset_mock()
+            encode_json(self.entry, pretty=True)
+            stub.dumps.assert_called_once_with(self.entry, escape_forward_slashes=False, indent=2, sort_keys=True)
+            self.entry['neo']['diameter_km'] = float('nan')
+            self.assertIn('"diameter_km":NaN', encode_json(self.entry).decode('utf-8'))
+            self.assertEqual(stub.dumps.call_count, 2)
+
+    @unittest.skipUnless(ujson, "ujson is not installed")
+    def test_encode_json_with_real_ujson(self):
+        with unittest.mock.patch('write.orjson', None), unittest.mock.patch('write.ujson', ujson):
+            expected = json.dumps(self.entry, sort_keys=True, indent=2)
+            self.assertEqual(encode_json(self.entry, pretty=True).decode('utf-8'), expected)
+
+            # ujson writes 1e-5 where the stdlib writes 1e-05, so compare the values.
+            self.entry['distance_au'] = 0.0000863186539409982
+            for pretty in (False, True):
+                self.assertEqual(json.loads(encode_json(self.entry, pretty)), self.entry)
+
+            self.entry['neo']['diameter_km'] = float('nan')
+            self.assertIn('"diameter_km":NaN', encode_json(self.entry).decode('utf-8'))
+            self.assertIn('"diameter_km": NaN', encode_json(self.entry, pretty=True).decode('utf-8'))
+
+    def test_encode_json_falls_back_to_stdlib(self):
+        with unittest.mock.patch('write.orjson', None), unittest.mock.patch('write.ujson', None):
+            expected = json.dumps(self.entry, separators=(',', ':'))
+            self.assertEqual(encode_json(self.entry).decode('utf-8'), expected)
+            expected = json.dumps(self.entry, sort_keys=True, indent=2, separators=(',', ': '))
+            self.assertEqual(encode_json(self.entry, pretty=True).decode('utf-8'), expected)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,19 +9,63 @@ function and the filename supplied by the user at the command line. The file's
 extension determines which of these functions is used.
 
 """
+import csv
 import json
-
-
-def write_to_csv(results, filename):
+import math
+import operator
+import os
+
+# Prefer orjson, then ujson, and fall back to the stdlib encoder.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+else:
+    try:
+        ujson.dumps(float("nan"))
+    except OverflowError:
+        # Older releases refuse NaN, which unknown diameters are written as.
+        ujson = None
+
+# Coalesce the many small per-row writes into few large ones.
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Fallback stdlib encoders, built once rather than by each `json.dumps` call.
+COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+PRETTY_JSON_ENCODER = json.JSONEncoder(sort_keys=True, indent=2, separators=(",", ": "))
+
+# Pull a CSV row's values out of a serialized close approach in one call.
+get_csv_row = operator.itemgetter(
+    "datetime_utc",
+    "distance_au",
+    "velocity_km_s",
+    "designation",
+    "name",
+    "diameter",
+    "hazardous",
+)
+
+
+def write_to_csv(results, filename, sync=False):
     """Write an iterable of `CloseApproach` objects to a CSV file.
 
     The precise output specification is in `README.md`. Roughly, each
     output row corresponds to the information in a single close approach
     from the `results` stream and its associated near-Earth object.
 
+    Output is only flushed when the file is closed, never per row. If
+    `sync` is set, the file is additionally fsynced once, just before it
+    is closed.
+
     :param results: An iterable of `CloseApproach` objects.
     :param filename: A Path-like object pointing to where the data should
                      be saved.
+    :param sync: Whether to fsync the file to disk before closing it.
     """
     fieldnames = (
         "datetime_utc",
@@ -33,29 +77,22 @@ def write_to_csv(results, filename):
         "potentially_hazardous",
     )
 
-    with open(filename, "x+") as f:
-        header_line = ",".join(fieldnames) + ",\n"
-        f.write(header_line)
-
-        for approach in results:
-            data = approach.serialize()
-
-            result = ""
-
-            result += str(data["datetime_utc"]) + ","
-            result += str(data["distance_au"]) + ","
-            result += str(data["velocity_km_s"]) + ","
-            result += str(data["designation"]) + ","
-            result += str(data["name"]) + ","
-            result += str(data["diameter"]) + ","
-            result += str(data["hazardous"]) + ","
+    # The csv module needs a text file, but newline="" and a fixed encoding keep
+    # the text layer from translating newlines or consulting the locale.
+    with open(
+        filename, "x+", buffering=WRITE_BUFFER_SIZE, encoding="utf-8", newline=""
+    ) as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(fieldnames)
+        writer.writerows(
+            map(get_csv_row, map(operator.methodcaller("serialize"), results))
+        )
 
-            result += "\n"
+        if sync:
+            sync_to_disk(f)
 
-            f.write(result)
 
-
-def write_to_json(results, filename):
+def write_to_json(results, filename, pretty=False, sync=False):
     """Write an iterable of `CloseApproach` objects to a JSON file.
 
     The precise output specification is in `README.md`. Roughly, the
@@ -63,37 +100,97 @@ def write_to_json(results, filename):
     `CloseApproach` attributes to their values and the 'neo' key
     mapping to a dictionary of the associated NEO's attributes.
 
+    Output is only flushed when the file is closed, never per entry. If
+    `sync` is set, the file is additionally fsynced once, just before it
+    is closed.
+
     :param results: An iterable of `CloseApproach` objects.
     :param filename: A Path-like object pointing to where the data should
     be saved.
+    :param pretty: Whether to indent the output and sort its keys, rather
+    than write compact JSON with keys in their specified order.
+    :param sync: Whether to fsync the file to disk before closing it.
     """
-    with open(filename, "w") as f:
-        entries = []
-        for result in results:
-            approach = result.serialize()
-            entry = extract_data_as_map(approach)
-            entries.append(entry)
+    with open(filename, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        # Stream one entry at a time, laid out as `json.dumps` would lay out
+        # the whole list, rather than building the list first.
+        newline = b"\n  " if pretty else b""
+        separator = newline
+        f.write(b"[")
+        for approach in results:
+            entry = encode_json(extract_data_as_map(approach), pretty)
+            if pretty:
+                entry = entry.replace(b"\n", newline)
+            f.write(separator + entry)
+            separator = b"," + newline
+
+        f.write(b"\n]" if pretty and separator != newline else b"]")
 
-        f.write(json.dumps(entries, sort_keys=True,
-                           indent=2, separators=(",", ": ")))
+        if sync:
+            sync_to_disk(f)
+
+
+def sync_to_disk(f):
+    """Flush an open file and fsync it, making its contents durable.
+
+    :param f: An open file object backed by a file descriptor
+    """
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def encode_json(entry, pretty=False):
+    """Encode a single entry as a JSON document.
+
+    orjson is used when it is installed, and otherwise ujson. orjson writes
+    NaN as `null`, whereas the output specification asks for the JSON value
+    `NaN`. As the diameter is the only value of an entry that can be NaN,
+    orjson encodes it as `null`, which is then replaced with `NaN`. ujson
+    writes `NaN` itself, and is only imported if it does.
+
+    :param entry: A dictionary as produced by `extract_data_as_map`
+    :param pretty: Whether to indent the document and sort its keys
+    :return The UTF-8 encoded JSON document as bytes
+    """
+    neo = entry["neo"]
+    finite = not (neo and math.isnan(neo["diameter_km"]))
+
+    if orjson is not None:
+        if not finite:
+            entry = {**entry, "neo": {**neo, "diameter_km": None}}
+
+        if pretty:
+            data = orjson.dumps(
+                entry, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+            )
+            null, nan = b'"diameter_km": null', b'"diameter_km": NaN'
+        else:
+            data = orjson.dumps(entry)
+            null, nan = b'"diameter_km":null', b'"diameter_km":NaN'
+
+        return data if finite else data.replace(null, nan, 1)
+
+    if ujson is not None:
+        if pretty:
+            data = ujson.dumps(
+                entry, escape_forward_slashes=False, indent=2, sort_keys=True
+            )
+        else:
+            data = ujson.dumps(entry, escape_forward_slashes=False)
+        return data.encode("utf-8")
+
+    if pretty:
+        return PRETTY_JSON_ENCODER.encode(entry).encode("utf-8")
+    return COMPACT_JSON_ENCODER.encode(entry).encode("utf-8")
 
 
 def extract_neo_data(neo):
     """Extract data relevant for a neo
 
-    :param neo: A neo to interrogate for data
+    :param neo: A `NearEarthObject` to interrogate for data
     :return The neo result as a dictionary sready to be converted to JSON
     """
-    result = {}
-    result["designation"] = neo["designation"]
-    if neo["name"] != "None":
-        result["name"] = neo["name"]
-    else:
-        result["name"] = ""
-    result["diameter_km"] = float(neo["diameter_km"])
-    result["potentially_hazardous"] = bool(neo["potentially_hazardous"])
-
-    return result
+    return neo.serialize()
 
 
 def extract_data_as_map(approach):
@@ -101,25 +198,17 @@ def extract_data_as_map(approach):
     Extract a Close Approach as a dictionary of relevent data
     items, including neo if available.
 
-    :param A close approach to parse
+    The approach is read attribute by attribute, rather than serialized to an
+    intermediate dictionary first; its neo serializes straight to output form.
+
+    :param A `CloseApproach` to parse
     :return A dictionary representing a close approach and neo if avilable
     """
-
-    entry = {}
-    entry["datetime_utc"] = str(approach["datetime_utc"])
-    entry["distance_au"] = float(approach["distance_au"])
-    entry["velocity_km_s"] = float(approach["velocity_km_s"])
-
-    neo = None
-    try:
-        neo = approach["neo"]
-    except KeyError:
-        neo = None
-
-    if neo:
-        neo_data = approach["neo"].serialize()
-        neo = extract_neo_data(neo_data)
-
-    entry["neo"] = neo
-
-    return entry
+    neo = approach.neo
+
+    return {
+        "datetime_utc": approach.time_str,
+        "distance_au": approach.distance,
+        "velocity_km_s": approach.velocity,
+        "neo": extract_neo_data(neo) if neo else None,
+    }